@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
+import aiohttp
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.util.ssl import client_context
 
 from .api import LivlyApiClient
 from .const import (
@@ -16,6 +19,7 @@ from .const import (
     CONF_REFRESH_TOKEN,
     CONF_TOKEN_EXPIRES_AT,
     CONF_USER_ID,
+    DEFAULT_HEADERS,
     DOMAIN,
 )
 from .coordinator import LivlyDataUpdateCoordinator
@@ -24,33 +28,82 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.SWITCH]
 
+DATA_CONNECTOR = "_connector"
+DATA_CONNECTOR_UNSUB = "_connector_unsub"
+
+# Polls are 30 minutes apart, so keep connections to the Livly hosts alive
+# well past aiohttp's 15 second default to avoid a TLS handshake every poll.
+KEEPALIVE_TIMEOUT = 3600
+
+
+def _async_get_connector(hass: HomeAssistant) -> aiohttp.TCPConnector:
+    """Return the connector shared by all Livly config entries."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_CONNECTOR in domain_data:
+        return domain_data[DATA_CONNECTOR]
+
+    connector = aiohttp.TCPConnector(
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=KEEPALIVE_TIMEOUT,
+        limit_per_host=4,
+        ssl=client_context(),
+    )
+    domain_data[DATA_CONNECTOR] = connector
+
+    # Entries aren't unloaded at shutdown, so close the connector on stop too
+    async def _async_close_connector(_event: Event) -> None:
+        await connector.close()
+
+    domain_data[DATA_CONNECTOR_UNSUB] = hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_CLOSE, _async_close_connector
+    )
+    return connector
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Livly from a config entry."""
-    session = async_get_clientsession(hass)
+    # Each entry gets its own session (and cookie jar) on the shared connector
+    session = aiohttp.ClientSession(
+        connector=_async_get_connector(hass),
+        connector_owner=False,
+        headers=DEFAULT_HEADERS,
+    )
+    entry.async_on_unload(session.close)
 
     # Create API client with stored credentials
-    client = LivlyApiClient(session)
+    client = LivlyApiClient(session, send_default_headers=False)
+    client.set_user_id(entry.data[CONF_USER_ID])
     client.set_tokens(
         access_token=entry.data[CONF_ACCESS_TOKEN],
         refresh_token=entry.data[CONF_REFRESH_TOKEN],
         id_token=entry.data[CONF_ID_TOKEN],
         expires_at=entry.data[CONF_TOKEN_EXPIRES_AT],
     )
-    client.set_user_id(entry.data[CONF_USER_ID])
 
     # Create coordinator
     coordinator = LivlyDataUpdateCoordinator(hass, client, entry)
 
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
-
-    # Store coordinator
+    # Store coordinator before forwarding so platforms can find it
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    # Set up platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Fetch initial data and set up platforms concurrently; entities read
+    # coordinator data lazily and update once the first refresh lands
+    results = await asyncio.gather(
+        coordinator.async_config_entry_first_refresh(),
+        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            coordinator.async_cancel_token_refresh()
+            await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+            hass.data[DOMAIN].pop(entry.entry_id)
+            raise result
+
+    # Keep tokens fresh between polls
+    coordinator.async_schedule_token_refresh()
+    entry.async_on_unload(coordinator.async_cancel_token_refresh)
 
     return True
 
@@ -60,4 +113,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
 
+        # Close the shared connector once the last entry is gone
+        if hass.data[DOMAIN].keys() == {DATA_CONNECTOR, DATA_CONNECTOR_UNSUB}:
+            hass.data[DOMAIN].pop(DATA_CONNECTOR_UNSUB)()
+            await hass.data[DOMAIN].pop(DATA_CONNECTOR).close()
+
     return unload_ok
@@ -1,10 +1,14 @@
 """API client for Livly."""
 
+import asyncio
+import base64
 import logging
 import time
 from typing import Any
 
 import aiohttp
+from aiohttp import hdrs
+import orjson
 
 from .const import (
     AUTH_CLIENT_ID,
@@ -20,6 +24,48 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# orjson is bundled with Home Assistant and parses much faster than json.loads
+_LOADS = orjson.loads
+
+# Constant body for the packages request, serialized once at import.
+# The application/json Content-Type comes from DEFAULT_HEADERS.
+_PACKAGES_PAYLOAD_BYTES = orjson.dumps(
+    {
+        "historyOrInventory": "Inventory",
+        "sort": {
+            "direction": "Desc",
+            "type": "ScannedByTimestamp",
+        },
+    }
+)
+
+# ID token claims that may carry the numeric Livly user ID
+_USER_ID_CLAIMS = ("https://livly/userId", "userId")
+
+
+def _decode_jwt_user_id(id_token: str | None) -> int | None:
+    """Return the Livly user ID from an ID token's claims, if present.
+
+    The token signature is not verified; it was received directly from the
+    OAuth endpoint and is only used to skip a user info lookup.
+    """
+    if not id_token:
+        return None
+    try:
+        payload = id_token.split(".")[1]
+        claims = _LOADS(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError):
+        return None
+    if not isinstance(claims, dict):
+        return None
+    for claim in _USER_ID_CLAIMS:
+        value = claims.get(claim)
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        if isinstance(value, str) and value.isdecimal():
+            return int(value)
+    return None
+
 
 class LivlyAuthError(Exception):
     """Exception for authentication errors."""
@@ -35,14 +81,28 @@ class LivlyApiClient:
     def __init__(
         self,
         session: aiohttp.ClientSession,
+        send_default_headers: bool = True,
     ) -> None:
-        """Initialize the API client."""
+        """Initialize the API client.
+
+        Pass send_default_headers=False if the session already sends
+        DEFAULT_HEADERS with every request.
+        """
         self._session = session
+        self._base_headers: dict[str, str] = (
+            DEFAULT_HEADERS if send_default_headers else {}
+        )
         self._access_token: str | None = None
         self._refresh_token: str | None = None
         self._id_token: str | None = None
         self._token_expires_at: float = 0
+        self._refresh_deadline_monotonic: float = 0
         self._user_id: int | None = None
+        self._packages_url: str | None = None
+        self._packages_etag: str | None = None
+        self._auth_headers: dict[str, str] | None = None
+        self._tokens_dirty = False
+        self._refresh_lock = asyncio.Lock()
 
     @property
     def access_token(self) -> str | None:
@@ -69,6 +129,15 @@ class LivlyApiClient:
         """Return the user ID."""
         return self._user_id
 
+    @property
+    def tokens_dirty(self) -> bool:
+        """Return whether tokens changed since they were last persisted."""
+        return self._tokens_dirty
+
+    def mark_tokens_saved(self) -> None:
+        """Mark the current tokens as persisted."""
+        self._tokens_dirty = False
+
     def set_tokens(
         self,
         access_token: str,
@@ -78,13 +147,33 @@ class LivlyApiClient:
     ) -> None:
         """Set the authentication tokens."""
         self._access_token = access_token
+        self._auth_headers = None
         self._refresh_token = refresh_token
         self._id_token = id_token
+        self._set_token_expiry(expires_at)
+        self._set_user_id_from_id_token()
+
+    def _set_token_expiry(self, expires_at: float) -> None:
+        """Store the token expiry and the monotonic deadline to refresh at."""
+        # The wall-clock expiry is persisted; the monotonic deadline is
+        # immune to clock steps. Refresh if token expires in under 5 minutes.
         self._token_expires_at = expires_at
+        self._refresh_deadline_monotonic = (
+            time.monotonic() + expires_at - time.time() - 300
+        )
+
+    def _set_user_id_from_id_token(self) -> None:
+        """Populate a missing user ID from the ID token to avoid a lookup."""
+        # Never override an ID that was stored or returned by the API
+        if self._user_id is not None:
+            return
+        if (user_id := _decode_jwt_user_id(self._id_token)) is not None:
+            self.set_user_id(user_id)
 
     def set_user_id(self, user_id: int) -> None:
         """Set the user ID."""
         self._user_id = user_id
+        self._packages_url = ENDPOINT_PACKAGES_FILTERED.format(user_id=user_id)
 
     async def request_otp(self, phone_number: str) -> bool:
         """Request an OTP code to be sent via SMS.
@@ -146,11 +235,14 @@ class LivlyApiClient:
                 json=payload,
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=_LOADS, content_type=None)
                     self._access_token = data["access_token"]
+                    self._auth_headers = None
                     self._refresh_token = data["refresh_token"]
                     self._id_token = data["id_token"]
-                    self._token_expires_at = time.time() + data["expires_in"]
+                    self._set_token_expiry(time.time() + data["expires_in"])
+                    self._tokens_dirty = True
+                    self._set_user_id_from_id_token()
                     return data
                 _LOGGER.error("OTP verification failed with status %s", response.status)
                 raise LivlyAuthError(f"Invalid OTP code: {response.status}")
@@ -170,6 +262,20 @@ class LivlyApiClient:
         Raises:
             LivlyAuthError: If refresh fails.
         """
+        # Only one refresh may be in flight: sending the same refresh token
+        # twice can be treated as token reuse and revoke it
+        access_token = self._access_token
+        async with self._refresh_lock:
+            # Another caller refreshed while we waited and the token is fresh
+            if (
+                self._access_token != access_token
+                and time.monotonic() < self._refresh_deadline_monotonic
+            ):
+                return True
+            return await self._refresh_access_token()
+
+    async def _refresh_access_token(self) -> bool:
+        """Refresh the access token; callers must hold the refresh lock."""
         if not self._refresh_token:
             raise LivlyAuthError("No refresh token available")
 
@@ -185,11 +291,14 @@ class LivlyApiClient:
                 json=payload,
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=_LOADS, content_type=None)
                     self._access_token = data["access_token"]
+                    self._auth_headers = None
                     self._refresh_token = data.get("refresh_token", self._refresh_token)
                     self._id_token = data.get("id_token", self._id_token)
-                    self._token_expires_at = time.time() + data["expires_in"]
+                    self._set_token_expiry(time.time() + data["expires_in"])
+                    self._tokens_dirty = True
+                    self._set_user_id_from_id_token()
                     return True
                 _LOGGER.error("Token refresh failed with status %s", response.status)
                 raise LivlyAuthError(f"Token refresh failed: {response.status}")
@@ -199,17 +308,20 @@ class LivlyApiClient:
 
     def _get_auth_headers(self) -> dict[str, str]:
         """Get headers for authenticated API requests."""
-        headers = DEFAULT_HEADERS.copy()
-        headers["Authorization"] = f"Bearer {self._access_token}"
-        return headers
+        # Rebuilt only after the access token changes
+        if self._auth_headers is None:
+            self._auth_headers = {
+                **self._base_headers,
+                "Authorization": f"Bearer {self._access_token}",
+            }
+        return self._auth_headers
 
     async def _ensure_valid_token(self) -> None:
         """Ensure we have a valid access token, refreshing if needed."""
         if not self._access_token:
             raise LivlyAuthError("Not authenticated")
 
-        # Refresh if token expires in less than 5 minutes
-        if time.time() > self._token_expires_at - 300:
+        if time.monotonic() >= self._refresh_deadline_monotonic:
             await self.refresh_access_token()
 
     async def get_user_info(self) -> dict[str, Any]:
@@ -222,15 +334,18 @@ class LivlyApiClient:
             LivlyApiError: If the request fails.
         """
         await self._ensure_valid_token()
+        return await self._fetch_user_info()
 
+    async def _fetch_user_info(self) -> dict[str, Any]:
+        """Fetch the current user's information with an already valid token."""
         try:
             async with self._session.get(
                 f"{ENDPOINT_USER_ME}?v=202404",
                 headers=self._get_auth_headers(),
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    self._user_id = data["Data"]["userId"]
+                    data = await response.json(loads=_LOADS, content_type=None)
+                    self.set_user_id(data["Data"]["userId"])
                     return data["Data"]
                 _LOGGER.error("Get user info failed with status %s", response.status)
                 raise LivlyApiError(f"Failed to get user info: {response.status}")
@@ -238,11 +353,14 @@ class LivlyApiClient:
             _LOGGER.error("Get user info error: %s", err)
             raise LivlyApiError(f"Connection error: {err}") from err
 
-    async def get_pending_packages(self) -> list[dict[str, Any]]:
+    async def get_pending_packages(self) -> list[dict[str, Any]] | None:
         """Get pending packages for the current user.
 
+        Sends the ETag from the previous response, if the API provided one, so
+        an unchanged package list can be answered without a body.
+
         Returns:
-            List of pending packages.
+            List of pending packages, or None if unchanged since the last call.
 
         Raises:
             LivlyApiError: If the request fails.
@@ -250,26 +368,28 @@ class LivlyApiClient:
         await self._ensure_valid_token()
 
         if not self._user_id:
-            await self.get_user_info()
+            await self._fetch_user_info()
 
-        url = ENDPOINT_PACKAGES_FILTERED.format(user_id=self._user_id)
-        payload = {
-            "historyOrInventory": "Inventory",
-            "sort": {
-                "direction": "Desc",
-                "type": "ScannedByTimestamp",
-            },
-        }
+        headers = self._get_auth_headers()
+        if etag := self._packages_etag:
+            headers = {**headers, hdrs.IF_NONE_MATCH: etag}
 
         try:
             async with self._session.post(
-                url,
-                headers=self._get_auth_headers(),
-                json=payload,
+                self._packages_url,
+                headers=headers,
+                data=_PACKAGES_PAYLOAD_BYTES,
             ) as response:
+                # A matching If-None-Match on a POST is answered with 412
+                # rather than 304; both mean the package list is unchanged
+                if etag and response.status in (304, 412):
+                    return None
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=_LOADS, content_type=None)
+                    self._packages_etag = response.headers.get(hdrs.ETAG)
                     return data.get("Data", [])
+                # Don't let a stale validator keep failing every poll
+                self._packages_etag = None
                 _LOGGER.error("Get packages failed with status %s", response.status)
                 raise LivlyApiError(f"Failed to get packages: {response.status}")
         except aiohttp.ClientError as err:
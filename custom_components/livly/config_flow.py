@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import re
 from typing import Any
 
 import voluptuous as vol
@@ -64,6 +63,27 @@ COUNTRY_CODES = [
 
 CONF_COUNTRY_CODE = "country_code"
 CONF_PHONE_LOCAL = "phone_local"
+CONF_OTP_CODE = "otp_code"
+
+# Form schemas are static, so build them once rather than on every step
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_COUNTRY_CODE, default="+1"): SelectSelector(
+            SelectSelectorConfig(
+                options=COUNTRY_CODES,
+                mode=SelectSelectorMode.DROPDOWN,
+            )
+        ),
+        vol.Required(CONF_PHONE_LOCAL): TextSelector(
+            TextSelectorConfig(type=TextSelectorType.TEL)
+        ),
+    }
+)
+_OTP_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_OTP_CODE): str,
+    }
+)
 
 
 class LivlyConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -87,7 +107,7 @@ class LivlyConfigFlow(ConfigFlow, domain=DOMAIN):
             phone_local = user_input[CONF_PHONE_LOCAL]
 
             # Strip any non-digit characters from the local number
-            phone_digits = re.sub(r"\D", "", phone_local)
+            phone_digits = "".join(filter(str.isdecimal, phone_local))
 
             if not phone_digits:
                 errors["base"] = "invalid_phone_format"
@@ -109,19 +129,7 @@ class LivlyConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_COUNTRY_CODE, default="+1"): SelectSelector(
-                        SelectSelectorConfig(
-                            options=COUNTRY_CODES,
-                            mode=SelectSelectorMode.DROPDOWN,
-                        )
-                    ),
-                    vol.Required(CONF_PHONE_LOCAL): TextSelector(
-                        TextSelectorConfig(type=TextSelectorType.TEL)
-                    ),
-                }
-            ),
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -132,17 +140,18 @@ class LivlyConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            otp_code = user_input["otp_code"].strip()
+            otp_code = user_input[CONF_OTP_CODE].strip()
 
             # Validate OTP format (must be exactly 6 digits)
-            if not re.match(r"^\d{6}$", otp_code):
+            if len(otp_code) != 6 or not otp_code.isdecimal():
                 errors["base"] = "invalid_otp_format"
             else:
                 try:
                     await self._client.verify_otp(self._phone_number, otp_code)
 
-                    # Get user info to obtain user ID
-                    await self._client.get_user_info()
+                    # Get user info if the ID token didn't carry the user ID
+                    if self._client.user_id is None:
+                        await self._client.get_user_info()
 
                     # Use last 4 digits for unique ID and title (privacy)
                     phone_last4 = self._phone_number[-4:]
@@ -171,11 +180,7 @@ class LivlyConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="otp",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("otp_code"): str,
-                }
-            ),
+            data_schema=_OTP_SCHEMA,
             errors=errors,
             description_placeholders={
                 "phone_number": masked_phone,
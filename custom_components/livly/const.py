@@ -20,10 +20,8 @@ OAUTH_GRANT_TYPE_REFRESH = "refresh_token"  # May need adjustment - untested
 # API headers
 DEFAULT_HEADERS = {
     "Accept": "application/json",
-    "Accept-Encoding": "gzip",
     "Connection": "Keep-Alive",
     "Content-Type": "application/json",
-    "Host": "api.livly.io",
     "User-Agent": "okhttp/4.12.0",
     "X-APP-ID": "com.livly.android.livly_resident",
 }
@@ -31,6 +29,12 @@ DEFAULT_HEADERS = {
 # Update interval (30 minutes)
 UPDATE_INTERVAL_MINUTES = 30
 
+# Refresh tokens this long before they expire, between polls
+TOKEN_REFRESH_LEAD_MINUTES = 10
+
+# Minimum delay before a scheduled token refresh, also used to retry timeouts
+TOKEN_REFRESH_MIN_DELAY_MINUTES = 5
+
 # Config keys
 CONF_PHONE_NUMBER = "phone_number"
 CONF_ACCESS_TOKEN = "access_token"
@@ -5,7 +5,8 @@ import logging
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
@@ -16,6 +17,8 @@ from .const import (
     CONF_REFRESH_TOKEN,
     CONF_TOKEN_EXPIRES_AT,
     DOMAIN,
+    TOKEN_REFRESH_LEAD_MINUTES,
+    TOKEN_REFRESH_MIN_DELAY_MINUTES,
     UPDATE_INTERVAL_MINUTES,
 )
 
@@ -42,6 +45,8 @@ class LivlyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._entry = entry
         self._sync_enabled = True
         self._last_update_time: datetime | None = None
+        self._last_update_iso: str | None = None
+        self._unsub_token_refresh: CALLBACK_TYPE | None = None
 
     @property
     def sync_enabled(self) -> bool:
@@ -53,11 +58,17 @@ class LivlyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Return the last successful update time."""
         return self._last_update_time
 
+    @property
+    def last_update_iso(self) -> str | None:
+        """Return the last successful update time as an ISO 8601 string."""
+        return self._last_update_iso
+
     async def async_set_sync_enabled(self, enabled: bool) -> None:
         """Enable or disable syncing."""
         self._sync_enabled = enabled
         if enabled:
-            # Resume polling and fetch immediately
+            # Resume polling and fetch immediately; the request is debounced,
+            # so toggling quickly doesn't cause back-to-back polls
             self.update_interval = timedelta(minutes=UPDATE_INTERVAL_MINUTES)
             await self.async_request_refresh()
         else:
@@ -70,13 +81,51 @@ class LivlyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Return the API client."""
         return self._client
 
+    @callback
+    def async_schedule_token_refresh(self) -> None:
+        """Schedule a token refresh ahead of expiry so polls don't wait on it."""
+        self.async_cancel_token_refresh()
+        # Never schedule in the past, or short-lived tokens would be
+        # refreshed in a tight loop
+        refresh_at = max(
+            dt_util.utc_from_timestamp(self._client.token_expires_at)
+            - timedelta(minutes=TOKEN_REFRESH_LEAD_MINUTES),
+            dt_util.utcnow() + timedelta(minutes=TOKEN_REFRESH_MIN_DELAY_MINUTES),
+        )
+        self._unsub_token_refresh = async_track_point_in_utc_time(
+            self.hass, self._async_refresh_tokens, refresh_at
+        )
+
+    @callback
+    def async_cancel_token_refresh(self) -> None:
+        """Cancel a scheduled token refresh."""
+        if self._unsub_token_refresh:
+            self._unsub_token_refresh()
+            self._unsub_token_refresh = None
+
+    async def _async_refresh_tokens(self, _now: datetime) -> None:
+        """Refresh and persist tokens."""
+        self._unsub_token_refresh = None
+        try:
+            await self._client.refresh_access_token()
+        except LivlyAuthError as err:
+            # Leave retries to the poll path, which refreshes on demand and
+            # reschedules this timer once tokens are refreshed
+            _LOGGER.warning("Scheduled token refresh failed: %s", err)
+            return
+        except TimeoutError as err:
+            _LOGGER.warning("Scheduled token refresh timed out: %s", err)
+            self.async_schedule_token_refresh()
+            return
+        await self._update_stored_tokens()
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API."""
         # Skip fetching if sync is disabled, return existing data
         if not self._sync_enabled:
             if self.data:
                 return self.data
-            return {"pending_packages": [], "pending_count": 0}
+            return {"pending_count": 0}
 
         try:
             packages = await self._client.get_pending_packages()
@@ -86,11 +135,14 @@ class LivlyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
             # Track last successful update time
             self._last_update_time = dt_util.utcnow()
+            self._last_update_iso = self._last_update_time.isoformat()
+
+            # Package list unchanged since the last poll
+            if packages is None:
+                return self.data
 
-            return {
-                "pending_packages": packages,
-                "pending_count": len(packages),
-            }
+            # Only the count is consumed; don't retain the full package list
+            return {"pending_count": len(packages)}
         except LivlyAuthError as err:
             _LOGGER.error("Authentication error: %s", err)
             raise UpdateFailed(f"Authentication error: {err}") from err
@@ -100,21 +152,18 @@ class LivlyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def _update_stored_tokens(self) -> None:
         """Update stored tokens if they changed during refresh."""
-        current_data = dict(self._entry.data)
-        updated = False
-
-        if self._client.access_token != current_data.get(CONF_ACCESS_TOKEN):
-            current_data[CONF_ACCESS_TOKEN] = self._client.access_token
-            updated = True
-        if self._client.refresh_token != current_data.get(CONF_REFRESH_TOKEN):
-            current_data[CONF_REFRESH_TOKEN] = self._client.refresh_token
-            updated = True
-        if self._client.id_token != current_data.get(CONF_ID_TOKEN):
-            current_data[CONF_ID_TOKEN] = self._client.id_token
-            updated = True
-        if self._client.token_expires_at != current_data.get(CONF_TOKEN_EXPIRES_AT):
-            current_data[CONF_TOKEN_EXPIRES_AT] = self._client.token_expires_at
-            updated = True
-
-        if updated:
-            self.hass.config_entries.async_update_entry(self._entry, data=current_data)
+        if not self._client.tokens_dirty:
+            return
+
+        new_data = {
+            **self._entry.data,
+            CONF_ACCESS_TOKEN: self._client.access_token,
+            CONF_REFRESH_TOKEN: self._client.refresh_token,
+            CONF_ID_TOKEN: self._client.id_token,
+            CONF_TOKEN_EXPIRES_AT: self._client.token_expires_at,
+        }
+        # Only write the config entry to disk if something actually changed
+        if new_data != self._entry.data:
+            self.hass.config_entries.async_update_entry(self._entry, data=new_data)
+        self._client.mark_tokens_saved()
+        self.async_schedule_token_refresh()
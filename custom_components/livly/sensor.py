@@ -10,12 +10,15 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import CONF_PHONE_NUMBER, DOMAIN
 from .coordinator import LivlyDataUpdateCoordinator
 
+_EMPTY: dict[str, Any] = {}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -41,20 +44,15 @@ class LivlyPendingPackagesSensor(CoordinatorEntity[LivlyDataUpdateCoordinator],
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_pending_packages"
         self._attr_name = "Pending Packages"
         self._attr_icon = "mdi:package-variant"
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device info."""
-        phone_last4 = self._entry.data[CONF_PHONE_NUMBER][-4:]
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": f"Livly (***{phone_last4})",
-            "manufacturer": "Livly",
-        }
+        phone_last4 = entry.data[CONF_PHONE_NUMBER][-4:]
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=f"Livly (***{phone_last4})",
+            manufacturer="Livly",
+        )
 
     @property
     def native_value(self) -> int | None:
@@ -66,9 +64,6 @@ class LivlyPendingPackagesSensor(CoordinatorEntity[LivlyDataUpdateCoordinator],
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        attrs: dict[str, Any] = {}
-
-        if self.coordinator.last_update_time:
-            attrs["last_checked"] = self.coordinator.last_update_time.isoformat()
-
-        return attrs
+        if (last_checked := self.coordinator.last_update_iso) is None:
+            return _EMPTY
+        return {"last_checked": last_checked}
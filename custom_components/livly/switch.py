@@ -7,6 +7,7 @@ from typing import Any
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -37,20 +38,15 @@ class LivlySyncSwitch(CoordinatorEntity[LivlyDataUpdateCoordinator], SwitchEntit
     ) -> None:
         """Initialize the switch."""
         super().__init__(coordinator)
-        self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_sync_enabled"
         self._attr_name = "Sync Enabled"
         self._attr_icon = "mdi:sync"
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device info."""
-        phone_last4 = self._entry.data[CONF_PHONE_NUMBER][-4:]
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": f"Livly (***{phone_last4})",
-            "manufacturer": "Livly",
-        }
+        phone_last4 = entry.data[CONF_PHONE_NUMBER][-4:]
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=f"Livly (***{phone_last4})",
+            manufacturer="Livly",
+        )
 
     @property
     def is_on(self) -> bool: